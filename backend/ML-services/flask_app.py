@@ -12,6 +12,7 @@ from improved_recommendation import (
     gen_tutors,
     generate_interactions,
     build_id_maps,
+    build_entity_columns,
     split_train_test,
     sample_lr_dataset,
     SUBJECTS,
@@ -31,6 +32,8 @@ students_data = None
 tutors_data = None
 
 MODEL_PATH = 'trained_model.pkl'
+# Bump when the pickled HybridTutorRecommender layout changes so stale files get retrained
+MODEL_VERSION = 8
 
 
 def train_and_save_model():
@@ -45,23 +48,29 @@ def train_and_save_model():
     tutors = gen_tutors(n_tutors)
     
     sid_to_idx, tid_to_idx, _, _ = build_id_maps(students, tutors)
-    interactions_all = generate_interactions(students, tutors, sid_to_idx, tid_to_idx)
+    # Column (SoA) views of the records, shared by every training step below
+    student_cols, tutor_cols = build_entity_columns(students, tutors)
+    interactions_all = generate_interactions(students, tutors, sid_to_idx, tid_to_idx,
+                                             student_cols, tutor_cols)
     interactions_train, _ = split_train_test(interactions_all, test_holdout_per_user=1)
     
     # sample_lr_dataset now handles 11 features (including TF-IDF)
     X_train, y_train, _, _ = sample_lr_dataset(
         students, tutors, interactions_train, 
-        sid_to_idx, tid_to_idx, neg_ratio=1.0
+        sid_to_idx, tid_to_idx, neg_ratio=1.0,
+        student_cols=student_cols, tutor_cols=tutor_cols
     )
     
     # Train model
     # Alpha=0.70 balances Content-Based (70%) with dynamic CF (30%)
     hybrid = HybridTutorRecommender(alpha=0.70) 
-    hybrid.fit(students, tutors, X_train, y_train, interactions_train)
+    hybrid.fit(students, tutors, X_train, y_train, interactions_train,
+               student_cols, tutor_cols)
     
     # Save model
     with open(MODEL_PATH, 'wb') as f:
         pickle.dump({
+            'version': MODEL_VERSION,
             'model': hybrid,
             'students': students,
             'tutors': tutors
@@ -80,9 +89,13 @@ def load_or_train_model():
         try:
             with open(MODEL_PATH, 'rb') as f:
                 data = pickle.load(f)
-                trained_model = data['model']
-                students_data = data['students']
-                tutors_data = data['tutors']
+            if data.get('version') != MODEL_VERSION:
+                print("Model file is from an older version. Retraining...")
+                trained_model, students_data, tutors_data = train_and_save_model()
+                return
+            trained_model = data['model']
+            students_data = data['students']
+            tutors_data = data['tutors']
             print("Model loaded successfully!")
         except (EOFError, pickle.UnpicklingError):
             print("Model file corrupted. Retraining...")
@@ -204,6 +217,46 @@ def get_recommendations():
         }), 500
 
 
+# Serialized /students and /tutors bodies; each is reused until a retrain or reload
+# replaces the record list it was built from
+list_response_cache = {}
+
+
+def cached_list_response(key: str, records: List[Dict[str, Any]], to_item):
+    """Returns the JSON list response for records, serializing it only once per record list."""
+    cached = list_response_cache.get(key)
+    if cached is None or cached[0] is not records:
+        items = [to_item(r) for r in records]
+        body = app.json.dumps({'success': True, key: items, 'count': len(items)})
+        cached = (records, body)
+        list_response_cache[key] = cached
+    return app.response_class(cached[1], mimetype='application/json')
+
+
+def student_list_item(s: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'student_id': s['student_id'],
+        'subject': s['preferred_subject'],
+        'level': s['preferred_level'],
+        'location': s['location'],
+        'learning_style': s['learning_style'],
+        'max_budget': s['max_budget'],
+        'profile_text': s['profile_text'] # NEW FIELD
+    }
+
+
+def tutor_list_item(t: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        'tutor_id': t['tutor_id'],
+        'subject': t['subject_specialization'],
+        'level': t['teaching_level'],
+        'location': t['tutor_location'],
+        'teaching_style': t['teaching_style'],
+        'hourly_rate': t['hourly_rate'],
+        'profile_text': t['profile_text'] # NEW FIELD
+    }
+
+
 @app.route('/students', methods=['GET'])
 def get_students():
     """Get list of all students"""
@@ -214,23 +267,7 @@ def get_students():
                 'error': 'No student data available'
             }), 503
         
-        students = []
-        for s in students_data:
-            students.append({
-                'student_id': s['student_id'],
-                'subject': s['preferred_subject'],
-                'level': s['preferred_level'],
-                'location': s['location'],
-                'learning_style': s['learning_style'],
-                'max_budget': s['max_budget'],
-                'profile_text': s['profile_text'] # NEW FIELD
-            })
-        
-        return jsonify({
-            'success': True,
-            'students': students,
-            'count': len(students)
-        })
+        return cached_list_response('students', students_data, student_list_item)
         
     except Exception as e:
         return jsonify({
@@ -249,23 +286,7 @@ def get_tutors():
                 'error': 'No tutor data available'
             }), 503
         
-        tutors = []
-        for t in tutors_data:
-            tutors.append({
-                'tutor_id': t['tutor_id'],
-                'subject': t['subject_specialization'],
-                'level': t['teaching_level'],
-                'location': t['tutor_location'],
-                'teaching_style': t['teaching_style'],
-                'hourly_rate': t['hourly_rate'],
-                'profile_text': t['profile_text'] # NEW FIELD
-            })
-        
-        return jsonify({
-            'success': True,
-            'tutors': tutors,
-            'count': len(tutors)
-        })
+        return cached_list_response('tutors', tutors_data, tutor_list_item)
         
     except Exception as e:
         return jsonify({
@@ -372,10 +393,11 @@ if __name__ == '__main__':
     # Load or train model on startup
     load_or_train_model()
     
-    # Run the Flask app
+    # Run the Flask development server; for production use a WSGI server with wsgi.py
     # Set the port to 5001 or ensure it's different from the Node.js server (5000)
     app.run(
         host='0.0.0.0',
         port=5001, # Using 5001 to avoid conflict with Node.js server
-        debug=True
+        debug=os.environ.get('FLASK_DEBUG') == '1',
+        threaded=True
     )
\ No newline at end of file
@@ -18,71 +18,123 @@ DAYS = ['Mon','Tue','Wed','Thu','Fri','Sat','Sun']
 SLOTS = ['AM','PM']
 NUM_TIME_SLOTS = len(DAYS) * len(SLOTS)
 
+# Categorical value -> integer code lookups, shared by the student and tutor sides
+SUBJECT_MAP = {s: i for i, s in enumerate(SUBJECTS)}
+LEVEL_MAP = {l: i for i, l in enumerate(LEVELS)}
+CITY_MAP = {c: i for i, c in enumerate(CITIES)}
+STYLE_MAP = {st: i for i, st in enumerate(LEARNING_STYLES)}
+CATEGORY_MAPS = {
+    'preferred_subject': SUBJECT_MAP, 'subject_specialization': SUBJECT_MAP,
+    'preferred_level': LEVEL_MAP, 'teaching_level': LEVEL_MAP,
+    'location': CITY_MAP, 'tutor_location': CITY_MAP,
+    'learning_style': STYLE_MAP, 'teaching_style': STYLE_MAP,
+}
+
+# Student-only encoded features (6-9): category code / number of categories
+ENCODED_KEYS = ['preferred_subject', 'preferred_level', 'location', 'learning_style']
+ENCODED_SIZES = np.array([len(SUBJECTS), len(LEVELS), len(CITIES), len(LEARNING_STYLES)], dtype=float)
+
+# Narrow storage types for the numeric entity columns
+COLUMN_DTYPES = {'max_budget': np.int16, 'hourly_rate': np.int16,
+                 'availability': np.uint64, 'available_slots': np.uint64}
+
 # Vocabulary for TF-IDF simulation
 VOCAB = ['patient', 'fun', 'structured', 'creative', 'deep', 'quick', 'results', 'flexible', 'expert', 'certified']
 
 
 # --- DATA GENERATION FUNCTIONS ---
 
-def random_timeslot_mask(avg_slots: int) -> int:
-    """Generates a random bitmask for availability slots."""
-    k = max(1, int(RNG.poisson(lam=avg_slots)))
-    idxs = RNG.choice(NUM_TIME_SLOTS, size=min(NUM_TIME_SLOTS, k), replace=False)
-    mask = 0
-    for i in idxs:
-        mask |= (1 << i)
-    return mask
+def gen_availabilities(n: int, avg_slots: int) -> np.ndarray:
+    """Generates n random availability bitmasks, each with Poisson(avg_slots) distinct slots (at least 1)."""
+    k = np.clip(RNG.poisson(lam=avg_slots, size=n), 1, NUM_TIME_SLOTS)
+    # The k smallest of NUM_TIME_SLOTS uniform draws pick k distinct slots per row
+    rand = RNG.random((n, NUM_TIME_SLOTS))
+    thresh = np.sort(rand, axis=1)[np.arange(n), k - 1]
+    bits = (rand <= thresh[:, None]).astype(np.uint64)
+    return bits @ (np.uint64(1) << np.arange(NUM_TIME_SLOTS, dtype=np.uint64))
+
+
+def gen_profile_texts(n: int, min_words: int, max_words: int) -> List[str]:
+    """Generates n profile texts of min_words to max_words - 1 distinct VOCAB words each."""
+    k = RNG.integers(min_words, max_words, size=n)
+    # A random permutation of the vocabulary per row, drawn in one call; keep each row's first k
+    order = RNG.permuted(np.tile(np.arange(len(VOCAB)), (n, 1)), axis=1)
+    return [" ".join(VOCAB[j] for j in row[:ki]) for row, ki in zip(order.tolist(), k.tolist())]
 
 
 def gen_students(n: int) -> List[Dict[str, Any]]:
     """Generates synthetic student data including max_budget and profile_text."""
-    students = []
-    for i in range(n):
-        s = {
+    # Draw every column in one call, then assemble the records
+    subjects = RNG.choice(SUBJECTS, size=n).tolist()
+    levels = RNG.choice(LEVELS, size=n).tolist()
+    cities = RNG.choice(CITIES, size=n).tolist()
+    styles = RNG.choice(LEARNING_STYLES, size=n).tolist()
+    budgets = RNG.choice([20, 30, 40, 50, 60], size=n).tolist()
+    availability = gen_availabilities(n, avg_slots=4).tolist()
+    profile_texts = gen_profile_texts(n, 2, 5)
+    return [
+        {
             'student_id': f's{i}',
-            'preferred_subject': RNG.choice(SUBJECTS),
-            'preferred_level': RNG.choice(LEVELS),
-            'location': RNG.choice(CITIES),
-            'availability': random_timeslot_mask(avg_slots=4),
-            'learning_style': RNG.choice(LEARNING_STYLES),
-            'max_budget': RNG.choice([20, 30, 40, 50, 60]),
-            'profile_text': " ".join(RNG.choice(VOCAB, size=RNG.integers(2, 5), replace=False)) # NEW TEXT FEATURE
+            'preferred_subject': subjects[i],
+            'preferred_level': levels[i],
+            'location': cities[i],
+            'availability': availability[i],
+            'learning_style': styles[i],
+            'max_budget': budgets[i],
+            'profile_text': profile_texts[i] # NEW TEXT FEATURE
         }
-        students.append(s)
-    return students
+        for i in range(n)
+    ]
 
 
 def gen_tutors(n: int) -> List[Dict[str, Any]]:
     """Generates synthetic tutor data including hourly_rate and profile_text."""
-    tutors = []
-    for i in range(n):
-        t = {
+    # Draw every column in one call, then assemble the records
+    subjects = RNG.choice(SUBJECTS, size=n).tolist()
+    levels = RNG.choice(LEVELS, size=n).tolist()
+    cities = RNG.choice(CITIES, size=n).tolist()
+    styles = RNG.choice(TEACHING_STYLES, size=n).tolist()
+    rates = RNG.choice([25, 35, 45, 55, 65], size=n).tolist()
+    available_slots = gen_availabilities(n, avg_slots=5).tolist()
+    profile_texts = gen_profile_texts(n, 3, 6)
+    return [
+        {
             'tutor_id': f't{i}',
-            'subject_specialization': RNG.choice(SUBJECTS),
-            'teaching_level': RNG.choice(LEVELS),
-            'tutor_location': RNG.choice(CITIES),
-            'available_slots': random_timeslot_mask(avg_slots=5),
-            'teaching_style': RNG.choice(TEACHING_STYLES),
-            'hourly_rate': RNG.choice([25, 35, 45, 55, 65]),
-            'profile_text': " ".join(RNG.choice(VOCAB, size=RNG.integers(3, 6), replace=False)) # NEW TEXT FEATURE
+            'subject_specialization': subjects[i],
+            'teaching_level': levels[i],
+            'tutor_location': cities[i],
+            'available_slots': available_slots[i],
+            'teaching_style': styles[i],
+            'hourly_rate': rates[i],
+            'profile_text': profile_texts[i] # NEW TEXT FEATURE
         }
-        tutors.append(t)
-    return tutors
+        for i in range(n)
+    ]
+
+
+def term_counts(docs: List[str]) -> np.ndarray:
+    """Counts of each VOCAB word per document, as an (n, len(VOCAB)) float32 matrix."""
+    return np.array([[words.count(w) for w in VOCAB] for words in (doc.lower().split() for doc in docs)],
+                    dtype=np.float32).reshape(len(docs), len(VOCAB))
 
 
-def compute_tfidf_similarity(doc1: str, doc2: str) -> float:
+def fit_idf(docs: List[str]) -> np.ndarray:
+    """Smoothed IDF weights of VOCAB over docs; stays positive even for words present in every document."""
+    df = np.count_nonzero(term_counts(docs), axis=0)
+    return (np.log((1 + len(docs)) / (1 + df)) + 1.0).astype(np.float32)
+
+
+def build_tfidf(docs: List[str], idf: np.ndarray = None) -> np.ndarray:
     """
-    Simulated TF-IDF vectorizer and Cosine Similarity calculation (no external libraries).
-    Since we don't have the corpus IDF, this is a simplified Bag-of-Words similarity.
+    TF-IDF vectorizer over VOCAB (no external libraries). Pass the idf from fit_idf to
+    weight several document sets alike; without it the IDF is fitted on docs.
+    Returns L2-normalized float32 rows, so the dot product of two rows is their cosine similarity.
     """
-    words1 = set(doc1.lower().split())
-    words2 = set(doc2.lower().split())
-    
-    intersection = len(words1.intersection(words2))
-    union = len(words1.union(words2))
-    
-   
-    return intersection / union if union > 0 else 0.0
+    if idf is None:
+        idf = fit_idf(docs)
+    W = term_counts(docs) * idf
+    W /= np.linalg.norm(W, axis=1, keepdims=True) + 1e-12
+    return W
 
 
 # --- FEATURE COMPUTATION AND INTERACTION LOGIC ---
@@ -106,120 +158,242 @@ def build_id_maps(students: List[Dict[str, Any]], tutors: List[Dict[str, Any]]):
     return sid_to_idx, tid_to_idx, idx_to_sid, idx_to_tid
 
 
+def build_columns(records: List[Dict[str, Any]], keys: List[str],
+                  idf: np.ndarray = None) -> Dict[str, np.ndarray]:
+    """
+    Materializes the given record attributes as one NumPy column per key (an SoA view
+    of the records). Categorical keys are stored as int8 codes from CATEGORY_MAPS
+    (-1 for unknown values) and numeric keys use COLUMN_DTYPES where listed.
+    'profile_tfidf' holds the (n, len(VOCAB)) TF-IDF rows of each profile_text, weighted
+    by idf, and 'encoded' the (n, 4) encoded features 6-9 (unknown values encode as 0).
+    """
+    cols = {}
+    for key in keys:
+        if key == 'profile_tfidf':
+            cols[key] = build_tfidf([r['profile_text'] for r in records], idf)
+        elif key == 'encoded':
+            codes = [[CATEGORY_MAPS[k].get(r[k], 0) for k in ENCODED_KEYS] for r in records]
+            cols[key] = np.array(codes, dtype=float).reshape(len(records), len(ENCODED_KEYS)) / ENCODED_SIZES
+        elif key in CATEGORY_MAPS:
+            table = CATEGORY_MAPS[key]
+            cols[key] = np.array([table.get(r[key], -1) for r in records], dtype=np.int8)
+        else:
+            cols[key] = np.array([r[key] for r in records], dtype=COLUMN_DTYPES.get(key))
+    return cols
+
+
+STUDENT_COLUMNS = ['preferred_subject', 'preferred_level', 'location', 'availability',
+                   'learning_style', 'max_budget', 'profile_tfidf', 'encoded']
+TUTOR_COLUMNS = ['subject_specialization', 'teaching_level', 'tutor_location', 'available_slots',
+                 'teaching_style', 'hourly_rate', 'profile_tfidf']
+
+
+def build_entity_columns(students: List[Dict[str, Any]],
+                         tutors: List[Dict[str, Any]]) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Builds the student and tutor columns together. The TF-IDF IDF is fitted once on all
+    profile texts, so feature 10 compares vectors weighted alike (identical texts score 1.0).
+    """
+    idf = fit_idf([r['profile_text'] for r in students] + [r['profile_text'] for r in tutors])
+    return build_columns(students, STUDENT_COLUMNS, idf), build_columns(tutors, TUTOR_COLUMNS, idf)
+
+
 def compute_pair_features(students: List[Dict[str, Any]],
                           tutors: List[Dict[str, Any]],
                           pair_s_idx: np.ndarray,
-                          pair_t_idx: np.ndarray) -> np.ndarray:
+                          pair_t_idx: np.ndarray,
+                          student_cols: Dict[str, np.ndarray] = None,
+                          tutor_cols: Dict[str, np.ndarray] = None) -> np.ndarray:
     """
     Computes an 11-feature vector for student-tutor pairs (includes TF-IDF score).
     Feature order: [subject(0), level(1), city(2), time(3), style(4), budget(5),
                     subject_enc(6), level_enc(7), city_enc(8), style_enc(9), TFIDF_SIMILARITY(10)]
+    Pass columns from build_entity_columns to reuse them across calls; categorical matches
+    compare the integer codes rather than strings.
     """
+    pair_s_idx = np.asarray(pair_s_idx, dtype=int)
+    pair_t_idx = np.asarray(pair_t_idx, dtype=int)
     n_pairs = len(pair_s_idx)
     
-    # Create encodings for categorical features
-    subject_map = {s: i for i, s in enumerate(SUBJECTS)}
-    level_map = {l: i for i, l in enumerate(LEVELS)}
-    city_map = {c: i for i, c in enumerate(CITIES)}
-    style_map = {st: i for i, st in enumerate(LEARNING_STYLES)}
-    
     X = np.zeros((n_pairs, 11), dtype=float) # INCREASED FROM 10 TO 11 FEATURES
+    if n_pairs == 0:
+        return X
+
+    if student_cols is None or tutor_cols is None:
+        student_cols, tutor_cols = build_entity_columns(students, tutors)
+    s = {key: col[pair_s_idx] for key, col in student_cols.items()}
+    t = {key: col[pair_t_idx] for key, col in tutor_cols.items()}
+
+    # Binary matches (Indices 0-5)
+    X[:, 0] = s['preferred_subject'] == t['subject_specialization']
+    X[:, 1] = s['preferred_level'] == t['teaching_level']
+    X[:, 2] = s['location'] == t['tutor_location']
+    X[:, 3] = (s['availability'] & t['available_slots']) != np.uint64(0)
+    X[:, 4] = s['learning_style'] == t['teaching_style']
+    X[:, 5] = s['max_budget'] >= t['hourly_rate']
+
+    # Encoded categorical features (Indices 6-9), gathered from the per-student table
+    X[:, 6:10] = s['encoded']
     
-    for i, (si, ti) in enumerate(zip(pair_s_idx, pair_t_idx)):
-        s = students[int(si)]
-        t = tutors[int(ti)]
-        
-        # Binary matches (Indices 0-5)
-        X[i, 0] = 1.0 if s['preferred_subject'] == t['subject_specialization'] else 0.0
-        X[i, 1] = 1.0 if s['preferred_level'] == t['teaching_level'] else 0.0
-        X[i, 2] = 1.0 if s['location'] == t['tutor_location'] else 0.0
-        X[i, 3] = float(time_overlap_mask(s['availability'], t['available_slots']))
-        X[i, 4] = style_similarity(s['learning_style'], t['teaching_style'])
-        X[i, 5] = 1.0 if s['max_budget'] >= t['hourly_rate'] else 0.0
-
-        # Encoded categorical features (Indices 6-9)
-        X[i, 6] = subject_map.get(s['preferred_subject'], 0) / len(SUBJECTS)
-        X[i, 7] = level_map.get(s['preferred_level'], 0) / len(LEVELS)
-        X[i, 8] = city_map.get(s['location'], 0) / len(CITIES)
-        X[i, 9] = style_map.get(s['learning_style'], 0) / len(LEARNING_STYLES)
-        
-        # SNEAKY NEW TF-IDF SIMILARITY FEATURE (Index 10)
-        X[i, 10] = compute_tfidf_similarity(s['profile_text'], t['profile_text'])
+    # SNEAKY NEW TF-IDF SIMILARITY FEATURE (Index 10): cosine of the normalized TF-IDF rows
+    X[:, 10] = np.einsum('ij,ij->i', s['profile_tfidf'], t['profile_tfidf'])
     
     return X
 
 
+def pair_score_matrix(student_cols: Dict[str, np.ndarray],
+                      tutor_cols: Dict[str, np.ndarray],
+                      weights: np.ndarray,
+                      bias: float = 0.0) -> np.ndarray:
+    """
+    Scores every (student, tutor) pair as weights @ features + bias, returned as an
+    (nS, nT) float32 matrix. Matches compute_pair_features feature by feature, but
+    accumulates broadcast comparisons into the score block without building the
+    (nS*nT, 11) feature matrix.
+    """
+    s, t = student_cols, tutor_cols
+    w = np.asarray(weights, dtype=np.float32)
+    M = (s['profile_tfidf'] @ t['profile_tfidf'].T) * w[10]
+    M += w[0] * (s['preferred_subject'][:, None] == t['subject_specialization'][None, :])
+    M += w[1] * (s['preferred_level'][:, None] == t['teaching_level'][None, :])
+    M += w[2] * (s['location'][:, None] == t['tutor_location'][None, :])
+    M += w[3] * ((s['availability'][:, None] & t['available_slots'][None, :]) != np.uint64(0))
+    M += w[4] * (s['learning_style'][:, None] == t['teaching_style'][None, :])
+    M += w[5] * (s['max_budget'][:, None] >= t['hourly_rate'][None, :])
+    # The encoded features (6-9) depend only on the student, so they add one offset per row
+    row_offset = s['encoded'] @ w[6:10] + np.float32(bias)
+    M += row_offset[:, None]
+    return M
+
+
 def generate_interactions(students: List[Dict[str, Any]],
                           tutors: List[Dict[str, Any]],
                           sid_to_idx: Dict[str,int],
-                          tid_to_idx: Dict[str,int]) -> List[Dict[str, Any]]:
+                          tid_to_idx: Dict[str,int],
+                          student_cols: Dict[str, np.ndarray] = None,
+                          tutor_cols: Dict[str, np.ndarray] = None) -> List[Dict[str, Any]]:
     """
     Generates synthetic interactions using prioritized feature weights.
     Weights are extended to 11 features.
     Priority: Subject (5.0) > Location (3.5) > Budget (3.0) > Style (2.5) > TFIDF (0.05)
     """
-    interactions = []
     nS, nT = len(students), len(tutors)
 
     # Prioritized Weights: [Subject(0), Level(1), Location(2), Time(3), Style(4), Budget(5), Encoded(6-9), TFIDF(10)]
     # TFIDF is "sneaky" with a low weight of 0.05
     weights = np.array([5.0, 1.5, 3.5, 1.0, 2.5, 3.0, 0.1, 0.1, 0.1, 0.1, 0.05]) # 11 ELEMENTS
 
-    for si in range(nS):
-        pair_s = np.full(nT, si, dtype=int)
-        pair_t = np.arange(nT, dtype=int)
-        X = compute_pair_features(students, tutors, pair_s, pair_t)
-        
-        scores = X @ weights + RNG.normal(0, 1.5, size=nT)
-
-        num_pos = int(np.clip(RNG.poisson(lam=3), 1, 8))
-        
-        top_idx = np.argsort(-scores)[:num_pos]
-        for ti in top_idx:
-            prob = 1 / (1 + np.exp(-scores[ti]))
-            if prob > 0.75:
-                itype = 'book'
-            elif prob > 0.45:
-                itype = 'contact'
-            else:
-                itype = 'view'
-            interactions.append({
-                'student_id': students[si]['student_id'],
-                'tutor_id': tutors[int(ti)]['tutor_id'],
-                'interaction_type': itype,
-            })
-    return interactions
+    if nS == 0 or nT == 0:
+        return []
+    if student_cols is None or tutor_cols is None:
+        student_cols, tutor_cols = build_entity_columns(students, tutors)
+
+    # Score every (student, tutor) pair in one block, then add the per-pair noise
+    scores = pair_score_matrix(student_cols, tutor_cols, weights)
+    scores += RNG.normal(0, 1.5, size=scores.shape)
+    num_pos = np.clip(RNG.poisson(lam=3, size=nS), 1, 8)
+
+    # Select each row's best max_pos tutors, order them by score and keep the first num_pos
+    max_pos = min(8, nT)
+    top = np.argpartition(-scores, max_pos - 1, axis=1)[:, :max_pos]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+    rows, ranks = np.nonzero(np.arange(max_pos)[None, :] < num_pos[:, None])
+
+    probs = 1 / (1 + np.exp(-top_scores[rows, ranks].astype(float)))
+    # Bucket all picks at once: view (<= 0.45), contact (<= 0.75), book (> 0.75)
+    itypes = INTERACTION_TYPES[np.digitize(probs, [0.45, 0.75], right=True)].tolist()
+    return [
+        {
+            'student_id': students[si]['student_id'],
+            'tutor_id': tutors[ti]['tutor_id'],
+            'interaction_type': itype,
+        }
+        for si, ti, itype in zip(rows.tolist(), top[rows, ranks].tolist(), itypes)
+    ]
 
 
 # --- MACHINE LEARNING COMPONENTS
 
 class LogisticRegressionFromScratch:
-    """Simple Logistic Regression implementation using NumPy for Content-Based scoring."""
-    def __init__(self, lr=0.1, iterations=2000, l2=0.01):
+    """Simple Logistic Regression implementation using NumPy for Content-Based scoring.
+
+    solver='newton' (default) fits with Newton-Raphson / IRLS steps, which converge in
+    a handful of iterations; solver='gd' runs plain gradient descent with step size lr.
+    Both stop early once the update (newton) or gradient (gd) falls below tol.
+    """
+    def __init__(self, lr=0.1, iterations=2000, l2=0.01, solver='newton', tol=1e-6):
         self.lr = lr
         self.iterations = iterations
         self.l2 = l2
+        self.solver = solver
+        self.tol = tol
         self.weights = None
         self.bias = 0.0
 
     @staticmethod
     def sigmoid(z):
-        z = np.clip(z, -500, 500)
-        return 1.0 / (1.0 + np.exp(-z))
+        # Equal to 1 / (1 + exp(-z)), but tanh saturates instead of overflowing, so no clip pass
+        return 0.5 * (np.tanh(0.5 * z) + 1.0)
 
     def fit(self, X: np.ndarray, y: np.ndarray):
         # NOTE: This automatically handles the 11-feature input vector
+        if self.solver == 'newton':
+            self._fit_newton(X, y)
+        else:
+            self._fit_gd(X, y)
+
+    def _fit_newton(self, X: np.ndarray, y: np.ndarray):
+        """Minimizes the same L2-regularized log-loss as _fit_gd with Newton steps H @ step = grad."""
+        n, d = X.shape
+        # Bias is the last column of the design matrix and is not regularized
+        X_b = np.hstack([X, np.ones((n, 1))])
+        y = np.asarray(y, dtype=float)
+        reg = np.full(d + 1, self.l2)
+        reg[-1] = 0.0
+        theta = np.zeros(d + 1)
+        for _ in range(self.iterations):
+            p = self.sigmoid(X_b @ theta)
+            grad = X_b.T @ (p - y) / n + reg * theta
+            hessian = (X_b.T * (p * (1.0 - p))) @ X_b / n
+            hessian[np.diag_indices_from(hessian)] += reg + 1e-10
+            step = np.linalg.solve(hessian, grad)
+            theta -= step
+            if np.max(np.abs(step)) < self.tol:
+                break
+        self.weights = theta[:-1].astype(np.float32)
+        self.bias = float(theta[-1])
+
+    def _fit_gd(self, X: np.ndarray, y: np.ndarray):
+        # Train on contiguous float32 copies; X.T is laid out once for the gradient GEMV
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        X_t = np.ascontiguousarray(X.T)
+        y = np.asarray(y, dtype=np.float32)
         n, d = X.shape
-        self.weights = np.zeros(d)
+        self.weights = np.zeros(d, dtype=np.float32)
         self.bias = 0.0
+        # Preallocated buffers: the logits are turned into the residual p - y in place
+        resid = np.empty(n, dtype=np.float32)
+        dw = np.empty(d, dtype=np.float32)
         for _ in range(self.iterations):
-            linear = X @ self.weights + self.bias
-            y_pred = self.sigmoid(linear)
-            error = y_pred - y
-            dw = (X.T @ error) / n + self.l2 * self.weights
-            db = np.sum(error) / n
+            np.matmul(X, self.weights, out=resid)
+            resid += self.bias
+            # sigmoid(z) = 0.5 * (tanh(z / 2) + 1), evaluated without temporaries
+            resid *= 0.5
+            np.tanh(resid, out=resid)
+            resid += 1.0
+            resid *= 0.5
+            resid -= y
+            np.matmul(X_t, resid, out=dw)
+            dw /= n
+            dw += self.l2 * self.weights
+            db = float(np.sum(resid)) / n
             self.weights -= self.lr * dw
             self.bias -= self.lr * db
+            if max(np.max(np.abs(dw)), abs(db)) < self.tol:
+                break
 
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
         return self.sigmoid(X @ self.weights + self.bias)
@@ -238,11 +412,13 @@ class ImplicitCollaborativeFiltering:
                                  sid_to_idx: Dict[str,int],
                                  tid_to_idx: Dict[str,int],
                                  nS: int, nT: int) -> np.ndarray:
-        M = np.zeros((nS, nT), dtype=float)
-        for inter in interactions:
-            sidx = sid_to_idx[inter['student_id']]
-            tidx = tid_to_idx[inter['tutor_id']]
-            M[sidx, tidx] = 1.0
+        # Collect the (student, tutor) coordinates and scatter them in one assignment
+        n = len(interactions)
+        sidx = np.fromiter((sid_to_idx[inter['student_id']] for inter in interactions), dtype=np.int32, count=n)
+        tidx = np.fromiter((tid_to_idx[inter['tutor_id']] for inter in interactions), dtype=np.int32, count=n)
+        # 0/1 flags only need a byte per cell; the similarity build casts to float32
+        M = np.zeros((nS, nT), dtype=np.uint8)
+        M[sidx, tidx] = 1
         self.interaction_matrix = M
         self.sid_to_idx = sid_to_idx
         self.tid_to_idx = tid_to_idx
@@ -250,20 +426,26 @@ class ImplicitCollaborativeFiltering:
         return M
 
     def compute_tutor_similarities(self, interaction_matrix: np.ndarray):
-        A = interaction_matrix.astype(float)
+        # float32 halves the bytes scores_for_student streams per request
+        A = interaction_matrix.astype(np.float32)
         item_norms = np.linalg.norm(A, axis=0)
         eps = 1e-8
-        item_norms = np.where(item_norms == 0.0, eps, item_norms)
+        inv_norms = 1.0 / np.where(item_norms == 0.0, eps, item_norms)
+        # Cosine normalization in place: scale rows, then columns, with no nT x nT denominator
         S = A.T @ A
-        denom = np.outer(item_norms, item_norms)
-        S = S / np.where(denom == 0, eps, denom)
+        S *= inv_norms[:, None]
+        S *= inv_norms[None, :]
         np.fill_diagonal(S, 0.0)
         self.similarity_matrix = S
         return S
 
     def scores_for_student(self, student_id: str) -> np.ndarray:
         sidx = self.sid_to_idx[student_id]
-        user_vector = self.interaction_matrix[sidx, :]
+        row = self.interaction_matrix[sidx, :]
+        # Cold start: with no interactions every CF score is 0, so skip the GEMV
+        if not row.any():
+            return np.zeros(len(row), dtype=np.float32)
+        user_vector = row.astype(np.float32)
         scores = user_vector @ self.similarity_matrix
         scores = np.where(user_vector > 0, 0.0, scores)
         return scores
@@ -280,55 +462,66 @@ class HybridTutorRecommender:
         self.sid_to_idx = None
         self.tid_to_idx = None
         self.idx_to_tid = None
+        self.student_cols = None
+        self.tutor_cols = None
+        self.lr_score_matrix = None
 
     def fit(self, students, tutors,
             X_features: np.ndarray, y_labels: np.ndarray,
-            interactions_train: List[Dict[str, Any]]):
+            interactions_train: List[Dict[str, Any]],
+            student_cols: Dict[str, np.ndarray] = None,
+            tutor_cols: Dict[str, np.ndarray] = None):
         self.students = students
         self.tutors = tutors
         self.sid_to_idx, self.tid_to_idx, _, self.idx_to_tid = build_id_maps(students, tutors)
+        # Entity attributes are static after fit; keep their columns for request-time scoring
+        if student_cols is None or tutor_cols is None:
+            student_cols, tutor_cols = build_entity_columns(students, tutors)
+        self.student_cols = student_cols
+        self.tutor_cols = tutor_cols
         nS, nT = len(students), len(tutors)
         self.lr_model.fit(X_features, y_labels)
+        # LR weights are frozen after fit, so score every (student, tutor) pair once
+        logits = pair_score_matrix(student_cols, tutor_cols, self.lr_model.weights, self.lr_model.bias)
+        self.lr_score_matrix = self.lr_model.sigmoid(logits)
         M = self.cf_model.build_interaction_matrix(interactions_train, self.sid_to_idx, self.tid_to_idx, nS, nT)
         self.cf_model.compute_tutor_similarities(M)
 
     def lr_scores_for_student(self, student_idx: int) -> np.ndarray:
-        """Gets Content-Based match scores for all tutors."""
-        nT = len(self.tutors)
-        pair_s = np.full(nT, student_idx, dtype=int)
-        pair_t = np.arange(nT, dtype=int)
-        # compute_pair_features now returns 11 features
-        X = compute_pair_features(self.students, self.tutors, pair_s, pair_t)
-        return self.lr_model.predict_proba(X)
+        """Gets Content-Based match scores for all tutors (a row of the matrix cached at fit)."""
+        return self.lr_score_matrix[student_idx]
 
     def recommend(self, student_id: str, top_n: int = 5) -> List[Tuple[str, float]]:
         sidx = self.sid_to_idx[student_id]
         lr_scores = self.lr_scores_for_student(sidx)
         cf_scores = self.cf_model.scores_for_student(student_id)
         
-        def normalize_agg(v):
-            v = v.astype(float)
+        scratch = np.empty(len(lr_scores))
+
+        def add_normalized(v, weight, out):
+            """out += weight * min-max normalized v; a constant v normalizes to 0.1."""
             vmax = np.max(v)
             vmin = np.min(v)
             if vmax - vmin < 1e-12:
-                return np.full_like(v, 0.1) 
-            return (v - vmin) / (vmax - vmin)
-            
-        lr_n = normalize_agg(lr_scores)
-        cf_n = normalize_agg(cf_scores)
-        
-        combined = self.alpha * lr_n + (1 - self.alpha) * cf_n
-        
-        # Inject larger random noise (0.05 std) for reliable tie-breaking and dynamism
-        noise = RNG.normal(0, 0.05, size=combined.shape) 
-        combined += noise
+                out += weight * 0.1
+                return
+            np.subtract(v, vmin, out=scratch, dtype=float)
+            np.multiply(scratch, weight / (vmax - vmin), out=scratch)
+            out += scratch
+
+        # Inject larger random noise (0.05 std) for reliable tie-breaking and dynamism;
+        # the noise array is the output buffer the blended scores accumulate into
+        combined = RNG.normal(0, 0.05, size=len(lr_scores))
+        add_normalized(lr_scores, self.alpha, combined)
+        add_normalized(cf_scores, 1 - self.alpha, combined)
 
         # Mask already seen items by setting their score to negative infinity
         seen = self.cf_model.interaction_matrix[sidx, :] > 0
-        combined = np.where(seen, -np.inf, combined)
+        combined[seen] = -np.inf
         
-        sorted_indices = np.argsort(-combined)
-        top_items_indices = sorted_indices[:top_n]
+        # Partial selection of the top_n, then order only those
+        top_items_indices = np.argpartition(-combined, kth=min(top_n, len(combined)-1))[:top_n]
+        top_items_indices = top_items_indices[np.argsort(-combined[top_items_indices])]
 
         return [(self.idx_to_tid[int(i)], float(combined[int(i)])) for i in top_items_indices]
     
@@ -365,41 +558,46 @@ def split_train_test(interactions: List[Dict[str, Any]], test_holdout_per_user:
 def sample_lr_dataset(students, tutors,
                       interactions_pos: List[Dict[str, Any]],
                       sid_to_idx: Dict[str,int], tid_to_idx: Dict[str,int],
-                      neg_ratio: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+                      neg_ratio: float = 1.0,
+                      student_cols: Dict[str, np.ndarray] = None,
+                      tutor_cols: Dict[str, np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """Generates a dataset for Logistic Regression with sampled negative pairs."""
     
-    pos_s_idx = []
-    pos_t_idx = []
-    for inter in interactions_pos:
-        pos_s_idx.append(sid_to_idx[inter['student_id']])
-        pos_t_idx.append(tid_to_idx[inter['tutor_id']])
-    pos_s_idx = np.array(pos_s_idx, dtype=int)
-    pos_t_idx = np.array(pos_t_idx, dtype=int)
+    n = len(interactions_pos)
+    pos_s_idx = np.fromiter((sid_to_idx[inter['student_id']] for inter in interactions_pos), dtype=int, count=n)
+    pos_t_idx = np.fromiter((tid_to_idx[inter['tutor_id']] for inter in interactions_pos), dtype=int, count=n)
 
     nS, nT = len(students), len(tutors)
-    interacted = defaultdict(set)
-    for s, t in zip(pos_s_idx, pos_t_idx):
-        interacted[int(s)].add(int(t))
-
-    neg_s_idx = []
-    neg_t_idx = []
-    for s in interacted.keys():
-        pos_count = len(interacted[s])
-        num_negs = int(max(1, neg_ratio * pos_count))
-        available = np.setdiff1d(np.arange(nT, dtype=int), np.array(list(interacted[s]), dtype=int), assume_unique=False)
-        if len(available) == 0:
-            continue
-        choose = min(len(available), num_negs)
-        sampled = RNG.choice(available, size=choose, replace=False)
-        neg_s_idx.extend([s] * choose)
-        neg_t_idx.extend(sampled.tolist())
-
-    neg_s_idx = np.array(neg_s_idx, dtype=int)
-    neg_t_idx = np.array(neg_t_idx, dtype=int)
+    # Mark every positive pair once; each student's negatives come from its unmarked tutors
+    pos_mask = np.zeros((nS, nT), dtype=bool)
+    pos_mask[pos_s_idx, pos_t_idx] = True
+    _, first_seen = np.unique(pos_s_idx, return_index=True)
+    users = pos_s_idx[np.sort(first_seen)]
+    user_pos = pos_mask[users]
+    pos_count = user_pos.sum(axis=1)
+    num_negs = np.maximum(1, (neg_ratio * pos_count).astype(int))
+    choose = np.minimum(num_negs, nT - pos_count)
+
+    k = int(choose.max(initial=0))
+    if k > 0:
+        # Positives get keys above every negative, so the k smallest uniform keys of a row
+        # are a sample without replacement from that student's negatives
+        keys = RNG.random(user_pos.shape)
+        keys[user_pos] = 2.0
+        cand = np.argpartition(keys, k - 1, axis=1)[:, :k]
+        cand = np.take_along_axis(cand, np.argsort(np.take_along_axis(keys, cand, axis=1), axis=1), axis=1)
+        rows, ranks = np.nonzero(np.arange(k)[None, :] < choose[:, None])
+        neg_s_idx = users[rows]
+        neg_t_idx = cand[rows, ranks]
+    else:
+        neg_s_idx = np.zeros(0, dtype=int)
+        neg_t_idx = np.zeros(0, dtype=int)
 
     # compute_pair_features now returns 11 features, which is transparent to the LR model
-    X_pos = compute_pair_features(students, tutors, pos_s_idx, pos_t_idx)
-    X_neg = compute_pair_features(students, tutors, neg_s_idx, neg_t_idx)
+    if student_cols is None or tutor_cols is None:
+        student_cols, tutor_cols = build_entity_columns(students, tutors)
+    X_pos = compute_pair_features(students, tutors, pos_s_idx, pos_t_idx, student_cols, tutor_cols)
+    X_neg = compute_pair_features(students, tutors, neg_s_idx, neg_t_idx, student_cols, tutor_cols)
     X = np.vstack([X_pos, X_neg])
     y = np.hstack([np.ones(len(X_pos)), np.zeros(len(X_neg))])
 
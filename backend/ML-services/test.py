@@ -1,86 +1,82 @@
 import numpy as np
 import pandas as pd
 
-# Generate Dataset (100 samples)
-np.random.seed(42)
+from improved_recommendation import LogisticRegressionFromScratch
 
-n_samples = 100    # total data points
-n_cf_features = 5  # simulated collaborative filtering features
-n_lr_features = 3  # tutor/user profile features
 
-# Collaborative Filtering Features (e.g., similarity scores)
-cf_features = np.random.rand(n_samples, n_cf_features)
+def make_dataset(n_samples=100, seed=42):
+    """Synthetic CF + profile features with labels from a fixed weight vector (80/20 split)."""
+    np.random.seed(seed)
 
-# Logistic Regression Features (e.g., skill match, experience, rating)
-experience = np.random.randint(1, 6, size=(n_samples, 1))  # 1–5
-skill_match = np.random.rand(n_samples, 1)
-availability = np.random.rand(n_samples, 1)
+    n_cf_features = 5  # simulated collaborative filtering features
+    n_lr_features = 3  # tutor/user profile features
 
-# Combine CF + LR features
-X = np.hstack([cf_features, experience, skill_match, availability])
+    # Collaborative Filtering Features (e.g., similarity scores)
+    cf_features = np.random.rand(n_samples, n_cf_features)
 
-# True weights to simulate outcome
-true_weights = np.array([0.6, -0.4, 0.8, 0.3, -0.2, 1.5, 1.0, 0.7, 0.3])
-z = X.dot(true_weights)
-y_prob = 1 / (1 + np.exp(-z / 10))
-y = (y_prob > 0.5).astype(int)
+    # Logistic Regression Features (e.g., skill match, experience, rating)
+    experience = np.random.randint(1, 6, size=(n_samples, 1))  # 1–5
+    skill_match = np.random.rand(n_samples, 1)
+    availability = np.random.rand(n_samples, 1)
 
-# Split into train/test (80/20)
-split = int(0.8 * n_samples)
-X_train, X_test = X[:split], X[split:]
-y_train, y_test = y[:split], y[split:]
+    # Combine CF + LR features
+    X = np.hstack([cf_features, experience, skill_match, availability])
 
+    # True weights to simulate outcome
+    true_weights = np.array([0.6, -0.4, 0.8, 0.3, -0.2, 1.5, 1.0, 0.7])  # one per column of X
+    z = X.dot(true_weights)
+    # Centre the logits on their median so both classes appear
+    z -= np.median(z)
+    y_prob = 1 / (1 + np.exp(-z / 10))
+    y = (y_prob > 0.5).astype(int)
 
-# 2️ Logistic Regression from Scratch
-def sigmoid(z):
-    return 1 / (1 + np.exp(-z))
+    # Split into train/test (80/20)
+    split = int(0.8 * n_samples)
+    return X[:split], X[split:], y[:split], y[split:]
 
-def logistic_regression_train(X, y, lr=0.05, epochs=2000):
-    weights = np.zeros(X.shape[1])
-    for _ in range(epochs):
-        z = np.dot(X, weights)
-        predictions = sigmoid(z)
-        gradient = np.dot(X.T, (predictions - y)) / y.size
-        weights -= lr * gradient
-    return weights
 
-def predict(X, weights):
-    preds = sigmoid(np.dot(X, weights))
-    return (preds >= 0.5).astype(int)
-
-# Train model
-weights = logistic_regression_train(X_train, y_train, lr=0.07, epochs=2500)
-y_pred = predict(X_test, weights)
+# 2️ Logistic Regression from Scratch (shared implementation from improved_recommendation)
+def train_and_predict(X_train, y_train, X_test, lr, epochs):
+    model = LogisticRegressionFromScratch(lr=lr, iterations=epochs, l2=0.0, solver='gd')
+    model.fit(X_train, y_train)
+    return (model.predict_proba(X_test) >= 0.5).astype(int)
 
 
 # 3️⃣ Evaluate Performance
 def confusion_matrix(y_true, y_pred):
-    tp = np.sum((y_true == 1) & (y_pred == 1))
-    tn = np.sum((y_true == 0) & (y_pred == 0))
-    fp = np.sum((y_true == 0) & (y_pred == 1))
-    fn = np.sum((y_true == 1) & (y_pred == 0))
+    # One pass: cell code 2*actual + predicted counts tn, fp, fn, tp
+    tn, fp, fn, tp = np.bincount(2 * y_true + y_pred, minlength=4)
     return np.array([[tp, fp],
                      [fn, tn]])
 
-cm = confusion_matrix(y_test, y_pred)
-accuracy = np.mean(y_test == y_pred)
-
-# -----------------------------
-# 4️⃣ Display Results
-# -----------------------------
-print("=== Confusion Matrix ===")
-print(pd.DataFrame(cm, index=["Actual Positive", "Actual Negative"],
-                   columns=["Predicted Positive", "Predicted Negative"]))
-print("\nAccuracy:", round(accuracy, 4))
-
-# Re-train if accuracy < 0.82
-if accuracy < 0.82:
-    print("\n🔁 Re-training with adjusted parameters...")
-    weights = logistic_regression_train(X_train, y_train, lr=0.09, epochs=3000)
-    y_pred = predict(X_test, weights)
+
+def main():
+    X_train, X_test, y_train, y_test = make_dataset()
+
+    # Train model
+    y_pred = train_and_predict(X_train, y_train, X_test, lr=0.07, epochs=2500)
     cm = confusion_matrix(y_test, y_pred)
     accuracy = np.mean(y_test == y_pred)
-    print("\n=== Tuned Model Results ===")
+
+    # -----------------------------
+    # 4️⃣ Display Results
+    # -----------------------------
+    print("=== Confusion Matrix ===")
     print(pd.DataFrame(cm, index=["Actual Positive", "Actual Negative"],
                        columns=["Predicted Positive", "Predicted Negative"]))
-    print("\n Final Accuracy:", round(accuracy, 4))
+    print("\nAccuracy:", round(accuracy, 4))
+
+    # Re-train if accuracy < 0.82
+    if accuracy < 0.82:
+        print("\n🔁 Re-training with adjusted parameters...")
+        y_pred = train_and_predict(X_train, y_train, X_test, lr=0.09, epochs=3000)
+        cm = confusion_matrix(y_test, y_pred)
+        accuracy = np.mean(y_test == y_pred)
+        print("\n=== Tuned Model Results ===")
+        print(pd.DataFrame(cm, index=["Actual Positive", "Actual Negative"],
+                           columns=["Predicted Positive", "Predicted Negative"]))
+        print("\n Final Accuracy:", round(accuracy, 4))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,22 @@
+import numpy as np
+
+from improved_recommendation import (
+    gen_students,
+    gen_tutors,
+    build_entity_columns,
+    compute_pair_features,
+)
+
+
+def test_identical_profile_texts_score_one():
+    students = gen_students(5)
+    tutors = gen_tutors(5)
+    tutors[0]['profile_text'] = students[0]['profile_text']
+    student_cols, tutor_cols = build_entity_columns(students, tutors)
+    X = compute_pair_features(students, tutors, np.array([0]), np.array([0]), student_cols, tutor_cols)
+    assert abs(X[0, 10] - 1.0) < 1e-6
+
+
+if __name__ == '__main__':
+    test_identical_profile_texts_score_one()
+    print("ok")
@@ -0,0 +1,12 @@
+"""
+WSGI entry point for running the ML API under a production server. From
+backend/ML-services (MODEL_PATH is relative), e.g.
+
+    gunicorn --preload -w 4 -b 0.0.0.0:5001 wsgi:app
+
+--preload loads (or trains) the model once in the master process so every
+worker shares it instead of racing to train and write the model file.
+"""
+from flask_app import app, load_or_train_model
+
+load_or_train_model()
@@ -14,45 +14,73 @@ INTERACTION_TYPES = np.array(['view', 'contact', 'book'])
 DAYS = ['Mon','Tue','Wed','Thu','Fri','Sat','Sun']
 SLOTS = ['AM','PM']
 NUM_TIME_SLOTS = len(DAYS) * len(SLOTS)
-
-
-def random_timeslot_mask(avg_slots: int) -> int:
-    k = max(1, int(RNG.poisson(lam=avg_slots)))
-    idxs = RNG.choice(NUM_TIME_SLOTS, size=min(NUM_TIME_SLOTS, k), replace=False)
-    mask = 0
-    for i in idxs:
-        mask |= (1 << i)
-    return mask
+# Bit value of each time slot in an availability mask
+SLOT_BITS = np.uint64(1) << np.arange(NUM_TIME_SLOTS, dtype=np.uint64)
+
+# Categorical value -> integer code lookups, shared by the student and tutor sides
+SUBJECT_MAP = {s: i for i, s in enumerate(SUBJECTS)}
+LEVEL_MAP = {l: i for i, l in enumerate(LEVELS)}
+CITY_MAP = {c: i for i, c in enumerate(CITIES)}
+STYLE_MAP = {st: i for i, st in enumerate(LEARNING_STYLES)}
+CATEGORY_MAPS = {
+    'preferred_subject': SUBJECT_MAP, 'subject_specialization': SUBJECT_MAP,
+    'preferred_level': LEVEL_MAP, 'teaching_level': LEVEL_MAP,
+    'location': CITY_MAP, 'tutor_location': CITY_MAP,
+    'learning_style': STYLE_MAP, 'teaching_style': STYLE_MAP,
+}
+
+# Narrow storage types for the numeric entity columns
+COLUMN_DTYPES = {'availability': np.uint64, 'available_slots': np.uint64}
+
+
+def random_timeslot_masks(n: int, avg_slots: int) -> np.ndarray:
+    """n random availability bitmasks, each with Poisson(avg_slots) distinct slots (at least 1)."""
+    k = np.clip(RNG.poisson(lam=avg_slots, size=n), 1, NUM_TIME_SLOTS)
+    # The k smallest of NUM_TIME_SLOTS uniform draws pick k distinct slots per row
+    rand = RNG.random((n, NUM_TIME_SLOTS))
+    thresh = np.sort(rand, axis=1)[np.arange(n), k - 1]
+    bits = (rand <= thresh[:, None]).astype(np.uint64)
+    return bits @ SLOT_BITS
 
 
 def gen_students(n: int) -> List[Dict[str, Any]]:
-    students = []
-    for i in range(n):
-        s = {
+    # Draw every column in one call, then assemble the records
+    subjects = RNG.choice(SUBJECTS, size=n).tolist()
+    levels = RNG.choice(LEVELS, size=n).tolist()
+    cities = RNG.choice(CITIES, size=n).tolist()
+    styles = RNG.choice(LEARNING_STYLES, size=n).tolist()
+    availability = random_timeslot_masks(n, avg_slots=4).tolist()
+    return [
+        {
             'student_id': f's{i}',
-            'preferred_subject': RNG.choice(SUBJECTS),
-            'preferred_level': RNG.choice(LEVELS),
-            'location': RNG.choice(CITIES),
-            'availability': random_timeslot_mask(avg_slots=4),
-            'learning_style': RNG.choice(LEARNING_STYLES),
+            'preferred_subject': subjects[i],
+            'preferred_level': levels[i],
+            'location': cities[i],
+            'availability': availability[i],
+            'learning_style': styles[i],
         }
-        students.append(s)
-    return students
+        for i in range(n)
+    ]
 
 
 def gen_tutors(n: int) -> List[Dict[str, Any]]:
-    tutors = []
-    for i in range(n):
-        t = {
+    # Draw every column in one call, then assemble the records
+    subjects = RNG.choice(SUBJECTS, size=n).tolist()
+    levels = RNG.choice(LEVELS, size=n).tolist()
+    cities = RNG.choice(CITIES, size=n).tolist()
+    styles = RNG.choice(TEACHING_STYLES, size=n).tolist()
+    available_slots = random_timeslot_masks(n, avg_slots=5).tolist()
+    return [
+        {
             'tutor_id': f't{i}',
-            'subject_specialization': RNG.choice(SUBJECTS),
-            'teaching_level': RNG.choice(LEVELS),
-            'tutor_location': RNG.choice(CITIES),
-            'available_slots': random_timeslot_mask(avg_slots=5),
-            'teaching_style': RNG.choice(TEACHING_STYLES),
+            'subject_specialization': subjects[i],
+            'teaching_level': levels[i],
+            'tutor_location': cities[i],
+            'available_slots': available_slots[i],
+            'teaching_style': styles[i],
         }
-        tutors.append(t)
-    return tutors
+        for i in range(n)
+    ]
 
 
 def time_overlap_mask(a_mask: int, b_mask: int) -> int:
@@ -64,6 +92,16 @@ def style_similarity(learn: str, teach: str) -> float:
     return 1.0 if learn == teach else 0.0
 
 
+def time_overlaps(a_masks: np.ndarray, b_masks: np.ndarray) -> np.ndarray:
+    # array form of time_overlap_mask over uint64 mask columns (broadcasts like &)
+    return (a_masks & b_masks) != np.uint64(0)
+
+
+def style_matches(learn_codes: np.ndarray, teach_codes: np.ndarray) -> np.ndarray:
+    # array form of style_similarity over style codes (broadcasts like ==)
+    return learn_codes == teach_codes
+
+
 def build_id_maps(students: List[Dict[str, Any]], tutors: List[Dict[str, Any]]):
     sid_to_idx = {s['student_id']: i for i, s in enumerate(students)}
     tid_to_idx = {t['tutor_id']: i for i, t in enumerate(tutors)}
@@ -72,63 +110,128 @@ def build_id_maps(students: List[Dict[str, Any]], tutors: List[Dict[str, Any]]):
     return sid_to_idx, tid_to_idx, idx_to_sid, idx_to_tid
 
 
+def top_k_indices(scores: np.ndarray, k: int, seen: np.ndarray = None) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first; entries flagged in seen are ranked last.
+    Callers that own scores can mask it in place instead; seen leaves scores untouched.
+    """
+    if seen is not None:
+        scores = np.where(seen, -np.inf, scores)
+    top = np.argpartition(-scores, kth=min(k, len(scores) - 1))[:k]
+    return top[np.argsort(-scores[top])]
+
+
+def build_columns(records: List[Dict[str, Any]], keys: List[str]) -> Dict[str, np.ndarray]:
+    """
+    Materializes the given record attributes as one NumPy column per key (an SoA view
+    of the records). Categorical keys are stored as int8 codes from CATEGORY_MAPS
+    (-1 for unknown values) and numeric keys use COLUMN_DTYPES where listed.
+    """
+    cols = {}
+    for key in keys:
+        if key in CATEGORY_MAPS:
+            table = CATEGORY_MAPS[key]
+            cols[key] = np.array([table.get(r[key], -1) for r in records], dtype=np.int8)
+        else:
+            cols[key] = np.array([r[key] for r in records], dtype=COLUMN_DTYPES.get(key))
+    return cols
+
+
+STUDENT_COLUMNS = ['preferred_subject', 'preferred_level', 'location', 'availability', 'learning_style']
+TUTOR_COLUMNS = ['subject_specialization', 'teaching_level', 'tutor_location', 'available_slots', 'teaching_style']
+
+
 def compute_pair_features(students: List[Dict[str, Any]],
                           tutors: List[Dict[str, Any]],
                           pair_s_idx: np.ndarray,
-                          pair_t_idx: np.ndarray) -> np.ndarray:
+                          pair_t_idx: np.ndarray,
+                          student_cols: Dict[str, np.ndarray] = None,
+                          tutor_cols: Dict[str, np.ndarray] = None) -> np.ndarray:
     """
     Returns X with columns:
     [subject_match, level_match, same_city, time_overlap, style_similarity]
+    Pass columns from build_columns to reuse them across calls.
     """
-    X = np.zeros((len(pair_s_idx), 5), dtype=float)
-    for i, (si, ti) in enumerate(zip(pair_s_idx, pair_t_idx)):
-        s = students[int(si)]
-        t = tutors[int(ti)]
-        X[i, 0] = 1.0 if s['preferred_subject'] == t['subject_specialization'] else 0.0
-        X[i, 1] = 1.0 if s['preferred_level'] == t['teaching_level'] else 0.0
-        X[i, 2] = 1.0 if s['location'] == t['tutor_location'] else 0.0
-        X[i, 3] = float(time_overlap_mask(s['availability'], t['available_slots']))
-        X[i, 4] = style_similarity(s['learning_style'], t['teaching_style'])
+    pair_s_idx = np.asarray(pair_s_idx, dtype=int)
+    pair_t_idx = np.asarray(pair_t_idx, dtype=int)
+    # Every feature is 0/1, so float32 is exact and halves the bytes LR training streams
+    X = np.zeros((len(pair_s_idx), 5), dtype=np.float32)
+    if len(pair_s_idx) == 0:
+        return X
+    if student_cols is None:
+        student_cols = build_columns(students, STUDENT_COLUMNS)
+    if tutor_cols is None:
+        tutor_cols = build_columns(tutors, TUTOR_COLUMNS)
+    s = {key: col[pair_s_idx] for key, col in student_cols.items()}
+    t = {key: col[pair_t_idx] for key, col in tutor_cols.items()}
+
+    X[:, 0] = s['preferred_subject'] == t['subject_specialization']
+    X[:, 1] = s['preferred_level'] == t['teaching_level']
+    X[:, 2] = s['location'] == t['tutor_location']
+    X[:, 3] = time_overlaps(s['availability'], t['available_slots'])
+    X[:, 4] = style_matches(s['learning_style'], t['teaching_style'])
     return X
 
 
+def pair_score_matrix(student_cols: Dict[str, np.ndarray],
+                      tutor_cols: Dict[str, np.ndarray],
+                      weights: np.ndarray,
+                      bias: float = 0.0) -> np.ndarray:
+    """
+    Scores every (student, tutor) pair as weights @ features + bias, returned as an
+    (nS, nT) float32 matrix. Matches compute_pair_features feature by feature, but
+    accumulates broadcast comparisons into the score block without building the
+    (nS*nT, 5) feature matrix.
+    """
+    s, t = student_cols, tutor_cols
+    w = np.asarray(weights, dtype=np.float32)
+    M = np.full((len(s['preferred_subject']), len(t['subject_specialization'])), bias, dtype=np.float32)
+    M += w[0] * (s['preferred_subject'][:, None] == t['subject_specialization'][None, :])
+    M += w[1] * (s['preferred_level'][:, None] == t['teaching_level'][None, :])
+    M += w[2] * (s['location'][:, None] == t['tutor_location'][None, :])
+    M += w[3] * time_overlaps(s['availability'][:, None], t['available_slots'][None, :])
+    M += w[4] * style_matches(s['learning_style'][:, None], t['teaching_style'][None, :])
+    return M
+
+
 def generate_interactions(students: List[Dict[str, Any]],
                           tutors: List[Dict[str, Any]],
                           sid_to_idx: Dict[str,int],
                           tid_to_idx: Dict[str,int]) -> List[Dict[str, Any]]:
-    interactions = []
     nS, nT = len(students), len(tutors)
+    if nS == 0 or nT == 0:
+        return []
 
-    # Precompute matrices for speed
-    # We'll compute heuristic scores for each student-tutor pair using the same engineered features.
-    # To keep it efficient, do it per-student without storing full NxM matrix.
+    # Heuristic scores for every student-tutor pair from the same engineered features,
+    # computed in one broadcast block plus one noise draw for all pairs.
     weights = np.array([1.2, 1.0, 0.8, 0.9, 0.6])
-
-    for si in range(nS):
-        # features for all tutors for student si
-        pair_s = np.full(nT, si, dtype=int)
-        pair_t = np.arange(nT, dtype=int)
-        X = compute_pair_features(students, tutors, pair_s, pair_t)
-        scores = X @ weights + RNG.normal(0, 0.3, size=nT)
-
-        # choose a random number of positives per student based on scores
-        num_pos = int(np.clip(RNG.poisson(lam=4), 1, 12))
-        top_idx = np.argsort(-scores)[:num_pos]
-        for ti in top_idx:
-            prob = 1 / (1 + np.exp(-scores[ti]))
-            # pick interaction type based on score/prob
-            if prob > 0.8:
-                itype = 'book'
-            elif prob > 0.6:
-                itype = 'contact'
-            else:
-                itype = 'view'
-            interactions.append({
-                'student_id': students[si]['student_id'],
-                'tutor_id': tutors[int(ti)]['tutor_id'],
-                'interaction_type': itype,
-            })
-    return interactions
+    student_cols = build_columns(students, STUDENT_COLUMNS)
+    tutor_cols = build_columns(tutors, TUTOR_COLUMNS)
+    score_matrix = pair_score_matrix(student_cols, tutor_cols, weights) + RNG.normal(0, 0.3, size=(nS, nT))
+    # choose a random number of positives per student based on scores
+    num_pos = np.clip(RNG.poisson(lam=4, size=nS), 1, 12)
+
+    # Select each row's best max_pos tutors, order them by score and keep the first num_pos;
+    # the (row, rank) picks index straight into the arrays, so nothing is appended per student
+    max_pos = min(12, nT)
+    top = np.argpartition(-score_matrix, max_pos - 1, axis=1)[:, :max_pos]
+    top_scores = np.take_along_axis(score_matrix, top, axis=1)
+    order = np.argsort(-top_scores, axis=1)
+    top = np.take_along_axis(top, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+    rows, ranks = np.nonzero(np.arange(max_pos)[None, :] < num_pos[:, None])
+
+    probs = 1 / (1 + np.exp(-top_scores[rows, ranks]))
+    # pick interaction type based on score/prob: view (<= 0.6), contact (<= 0.8), book (> 0.8)
+    itypes = INTERACTION_TYPES[np.digitize(probs, [0.6, 0.8], right=True)].tolist()
+    return [
+        {
+            'student_id': students[si]['student_id'],
+            'tutor_id': tutors[ti]['tutor_id'],
+            'interaction_type': itype,
+        }
+        for si, ti, itype in zip(rows.tolist(), top[rows, ranks].tolist(), itypes)
+    ]
 
 
 # -------------------------------
@@ -145,20 +248,33 @@ class LogisticRegressionFromScratch:
 
     @staticmethod
     def sigmoid(z):
-        # numerical stability
-        z = np.clip(z, -500, 500)
-        return 1.0 / (1.0 + np.exp(-z))
+        # Equal to 1 / (1 + exp(-z)), but tanh saturates instead of overflowing, so no clip pass
+        return 0.5 * (np.tanh(0.5 * z) + 1.0)
 
     def fit(self, X: np.ndarray, y: np.ndarray):
+        # Train in float32 on contiguous copies; X.T is laid out once for the gradient GEMV
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        X_t = np.ascontiguousarray(X.T)
+        y = np.asarray(y, dtype=np.float32)
         n, d = X.shape
-        self.weights = np.zeros(d)
+        self.weights = np.zeros(d, dtype=np.float32)
         self.bias = 0.0
+        # Preallocated buffers: the logits are turned into the residual p - y in place
+        resid = np.empty(n, dtype=np.float32)
+        dw = np.empty(d, dtype=np.float32)
         for _ in range(self.iterations):
-            linear = X @ self.weights + self.bias
-            y_pred = self.sigmoid(linear)
-            error = y_pred - y
-            dw = (X.T @ error) / n + self.l2 * self.weights
-            db = np.sum(error) / n
+            np.matmul(X, self.weights, out=resid)
+            resid += self.bias
+            # sigmoid() evaluated in place on the buffer (same tanh form, no temporaries)
+            resid *= 0.5
+            np.tanh(resid, out=resid)
+            resid += 1.0
+            resid *= 0.5
+            resid -= y
+            np.matmul(X_t, resid, out=dw)
+            dw /= n
+            dw += self.l2 * self.weights
+            db = float(np.sum(resid)) / n
             self.weights -= self.lr * dw
             self.bias -= self.lr * db
 
@@ -180,17 +296,24 @@ class ImplicitCollaborativeFiltering:
         self.tid_to_idx = None
         self.idx_to_tid = None
         self.interaction_matrix = None  # (n_users, n_items)
+        # CSR-style item lists: user u's items are user_items[user_indptr[u]:user_indptr[u+1]]
+        self.user_indptr = None
+        self.user_items = None
 
     def build_interaction_matrix(self, interactions: List[Dict[str, Any]],
                                  sid_to_idx: Dict[str,int],
                                  tid_to_idx: Dict[str,int],
                                  nS: int, nT: int) -> np.ndarray:
-        M = np.zeros((nS, nT), dtype=float)
-        for inter in interactions:
-            sidx = sid_to_idx[inter['student_id']]
-            tidx = tid_to_idx[inter['tutor_id']]
-            M[sidx, tidx] = 1.0  # implicit binary
+        # Collect the (student, tutor) coordinates and scatter them in one assignment
+        n = len(interactions)
+        sidx = np.fromiter((sid_to_idx[inter['student_id']] for inter in interactions), dtype=np.int32, count=n)
+        tidx = np.fromiter((tid_to_idx[inter['tutor_id']] for inter in interactions), dtype=np.int32, count=n)
+        # implicit binary; 0/1 flags only need a byte per cell
+        M = np.zeros((nS, nT), dtype=np.uint8)
+        M[sidx, tidx] = 1
         self.interaction_matrix = M
+        rows, self.user_items = np.nonzero(M)  # row-major, so each user's items are contiguous
+        self.user_indptr = np.searchsorted(rows, np.arange(nS + 1))
         self.sid_to_idx = sid_to_idx
         self.tid_to_idx = tid_to_idx
         self.idx_to_tid = {v: k for k, v in tid_to_idx.items()}
@@ -198,17 +321,16 @@ class ImplicitCollaborativeFiltering:
 
     def compute_tutor_similarities(self, interaction_matrix: np.ndarray):
         # item-item cosine similarity
-        # items are columns
-        A = interaction_matrix.astype(float)
-        # Compute norms for each item
+        # items are columns; float32 halves the bytes of S and of every row read from it
+        A = interaction_matrix.astype(np.float32)
+        # Compute norms for each item; unused items keep a zero column
         item_norms = np.linalg.norm(A, axis=0)
-        # To avoid div by zero, set zeros to eps
-        eps = 1e-8
-        item_norms = np.where(item_norms == 0.0, eps, item_norms)
-        # Similarity = (A^T A) / (||i|| * ||j||)
+        item_norms[item_norms == 0.0] = 1.0
+        # Similarity = (A^T A) / (||i|| * ||j||): normalize the columns once, then it is a plain product
+        A /= item_norms
+        # Both operands are the same buffer, which lets NumPy use a symmetric rank-k
+        # update (syrk) that computes one triangle and mirrors it
         S = A.T @ A
-        denom = np.outer(item_norms, item_norms)
-        S = S / np.where(denom == 0, eps, denom)
         np.fill_diagonal(S, 0.0)  # remove self-similarity
         self.similarity_matrix = S
         return S
@@ -217,23 +339,29 @@ class ImplicitCollaborativeFiltering:
         if self.similarity_matrix is None or self.interaction_matrix is None:
             raise ValueError("CF model not trained.")
         sidx = self.sid_to_idx[student_id]
-        user_vector = self.interaction_matrix[sidx, :]  # (n_items,)
-        # score for items = sum over items liked by user of sim(liked, item)
-        scores = user_vector @ self.similarity_matrix  # (n_items,)
-        # don't recommend seen items
-        scores = np.where(user_vector > 0, -np.inf, scores)
-        top_items = np.argpartition(-scores, kth=min(top_k, len(scores)-1))[:top_k]
-        # sort top items by score desc
-        top_items = top_items[np.argsort(-scores[top_items])]
+        items = self.items_for_student(sidx)
+        scores = self.item_scores(items)  # (n_items,)
+        # don't recommend seen items (item_scores returns a fresh array)
+        scores[items] = -np.inf
+        top_items = top_k_indices(scores, top_k)
         return [self.idx_to_tid[int(i)] for i in top_items]
 
+    def items_for_student(self, student_idx: int) -> np.ndarray:
+        return self.user_items[self.user_indptr[student_idx]:self.user_indptr[student_idx + 1]]
+
+    def item_scores(self, items: np.ndarray) -> np.ndarray:
+        # score for items = sum over items liked by user of sim(liked, item); only the
+        # liked items' similarity rows are read instead of a GEMV over the full matrix
+        if len(items) == 0:
+            return np.zeros(self.similarity_matrix.shape[1], dtype=np.float32)
+        return self.similarity_matrix[items].sum(axis=0)
+
     def scores_for_student(self, student_id: str) -> np.ndarray:
         # returns score vector for all items
-        sidx = self.sid_to_idx[student_id]
-        user_vector = self.interaction_matrix[sidx, :]
-        scores = user_vector @ self.similarity_matrix
+        items = self.items_for_student(self.sid_to_idx[student_id])
+        scores = self.item_scores(items)
         # zero out seen items (set to 0 instead of -inf for hybrid scoring)
-        scores = np.where(user_vector > 0, 0.0, scores)
+        scores[items] = 0.0
         return scores
 
 
@@ -251,6 +379,9 @@ class HybridTutorRecommender:
         self.sid_to_idx = None
         self.tid_to_idx = None
         self.idx_to_tid = None
+        self.student_cols = None
+        self.tutor_cols = None
+        self.lr_score_matrix = None
 
     def fit(self, students, tutors,
             X_features: np.ndarray, y_labels: np.ndarray,
@@ -258,18 +389,19 @@ class HybridTutorRecommender:
         self.students = students
         self.tutors = tutors
         self.sid_to_idx, self.tid_to_idx, _, self.idx_to_tid = build_id_maps(students, tutors)
+        self.student_cols = build_columns(students, STUDENT_COLUMNS)
+        self.tutor_cols = build_columns(tutors, TUTOR_COLUMNS)
         nS, nT = len(students), len(tutors)
         self.lr_model.fit(X_features, y_labels)
+        # LR weights are frozen after fit, so score every (student, tutor) pair once
+        logits = pair_score_matrix(self.student_cols, self.tutor_cols, self.lr_model.weights, self.lr_model.bias)
+        self.lr_score_matrix = self.lr_model.sigmoid(logits)
         M = self.cf_model.build_interaction_matrix(interactions_train, self.sid_to_idx, self.tid_to_idx, nS, nT)
         self.cf_model.compute_tutor_similarities(M)
 
     def lr_scores_for_student(self, student_idx: int) -> np.ndarray:
-        # Compute LR probabilities for all tutors for a given student
-        nT = len(self.tutors)
-        pair_s = np.full(nT, student_idx, dtype=int)
-        pair_t = np.arange(nT, dtype=int)
-        X = compute_pair_features(self.students, self.tutors, pair_s, pair_t)
-        return self.lr_model.predict_proba(X)
+        # LR probabilities for all tutors for a given student (a row of the matrix cached at fit)
+        return self.lr_score_matrix[student_idx]
 
     def recommend(self, student_id: str, top_n: int = 5) -> List[Tuple[str, float]]:
         sidx = self.sid_to_idx[student_id]
@@ -278,19 +410,25 @@ class HybridTutorRecommender:
         # normalize scores to [0,1]
         def normalize(v):
             v = v.astype(float)
-            vmax = np.max(v) if np.max(v) > 0 else 1.0
-            vmin = np.min(v)
-            if vmax - vmin < 1e-12:
+            vmin, vmax = v.min(), v.max()
+            if vmax <= 0:
+                vmax = 1.0
+            span = vmax - vmin
+            if span < 1e-12:
                 return np.zeros_like(v)
-            return (v - vmin) / (vmax - vmin)
-        lr_n = normalize(lr_scores)
+            # rescale the fresh copy in place, multiplying by the reciprocal span
+            v -= vmin
+            v *= 1.0 / span
+            return v
+        # normalize returns fresh arrays, so the blend and the masking run in place
+        combined = normalize(lr_scores)
+        combined *= self.alpha
         cf_n = normalize(cf_scores)
-        combined = self.alpha * lr_n + (1 - self.alpha) * cf_n
+        cf_n *= 1 - self.alpha
+        combined += cf_n
         # mask already seen items
-        seen = self.cf_model.interaction_matrix[sidx, :] > 0
-        combined = np.where(seen, -np.inf, combined)
-        top_items = np.argpartition(-combined, kth=min(top_n, len(combined)-1))[:top_n]
-        top_items = top_items[np.argsort(-combined[top_items])]
+        combined[self.cf_model.items_for_student(sidx)] = -np.inf
+        top_items = top_k_indices(combined, top_n)
         return [(self.idx_to_tid[int(i)], float(combined[int(i)])) for i in top_items]
 
 
@@ -299,21 +437,32 @@ class HybridTutorRecommender:
 # -------------------------------
 
 def split_train_test(interactions: List[Dict[str, Any]], test_holdout_per_user: int = 1):
-    by_user = defaultdict(list)
-    for inter in interactions:
-        by_user[inter['student_id']].append(inter['tutor_id'])
-    train, test = [], []
-    for sid, items in by_user.items():
-        items_arr = np.array(items)
-        RNG.shuffle(items_arr)
-        k = min(test_holdout_per_user, len(items_arr) // 2 if len(items_arr) >= 2 else 0)
-        test_items = items_arr[:k]
-        train_items = items_arr[k:]
-        for tid in train_items:
-            train.append({'student_id': sid, 'tutor_id': tid, 'interaction_type': 'pos'})
-        for tid in test_items:
-            test.append({'student_id': sid, 'tutor_id': tid, 'interaction_type': 'pos'})
-    return train, test
+    sids = np.array([inter['student_id'] for inter in interactions])
+    tids = np.array([inter['tutor_id'] for inter in interactions])
+    # Group rows by student with one stable sort; groups are numbered in order of first
+    # appearance and rows keep their input order inside each group
+    users, first_seen, codes = np.unique(sids, return_index=True, return_inverse=True)
+    by_appearance = np.argsort(first_seen)
+    group_of_code = np.empty(len(users), dtype=int)
+    group_of_code[by_appearance] = np.arange(len(users))
+    groups = group_of_code[codes]
+    order = np.argsort(groups, kind='stable')
+    groups = groups[order]
+    bounds = np.searchsorted(groups, np.arange(len(users) + 1))
+    # Shuffle each student's slice of the grouped tutor array in place
+    items = tids[order]
+    for g in range(len(users)):
+        RNG.shuffle(items[bounds[g]:bounds[g + 1]])
+    # The first k shuffled items of each group are held out
+    sizes = np.diff(bounds)
+    k = np.minimum(test_holdout_per_user, np.where(sizes >= 2, sizes // 2, 0))
+    is_test = (np.arange(len(items)) - bounds[groups]) < k[groups]
+    row_sids = users[by_appearance][groups]
+
+    def to_records(mask):
+        return [{'student_id': sid, 'tutor_id': tid, 'interaction_type': 'pos'}
+                for sid, tid in zip(row_sids[mask].tolist(), items[mask].tolist())]
+    return to_records(~is_test), to_records(is_test)
 
 
 def sample_lr_dataset(students, tutors,
@@ -321,40 +470,43 @@ def sample_lr_dataset(students, tutors,
                       sid_to_idx: Dict[str,int], tid_to_idx: Dict[str,int],
                       neg_ratio: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     # Build positive pairs
-    pos_s_idx = []
-    pos_t_idx = []
-    for inter in interactions_pos:
-        pos_s_idx.append(sid_to_idx[inter['student_id']])
-        pos_t_idx.append(tid_to_idx[inter['tutor_id']])
-    pos_s_idx = np.array(pos_s_idx, dtype=int)
-    pos_t_idx = np.array(pos_t_idx, dtype=int)
+    n = len(interactions_pos)
+    pos_s_idx = np.fromiter((sid_to_idx[inter['student_id']] for inter in interactions_pos), dtype=int, count=n)
+    pos_t_idx = np.fromiter((tid_to_idx[inter['tutor_id']] for inter in interactions_pos), dtype=int, count=n)
 
     # Negative sampling: for each positive, sample 'neg_ratio' negatives for same student
     nS, nT = len(students), len(tutors)
-    interacted = defaultdict(set)
-    for s, t in zip(pos_s_idx, pos_t_idx):
-        interacted[int(s)].add(int(t))
-
-    neg_s_idx = []
-    neg_t_idx = []
-    for s in interacted.keys():
-        pos_count = len(interacted[s])
-        num_negs = int(max(1, neg_ratio * pos_count))
-        # sample from non-interacted
-        available = np.setdiff1d(np.arange(nT, dtype=int), np.array(list(interacted[s]), dtype=int), assume_unique=False)
-        if len(available) == 0:
-            continue
-        choose = min(len(available), num_negs)
-        sampled = RNG.choice(available, size=choose, replace=False)
-        neg_s_idx.extend([s] * choose)
-        neg_t_idx.extend(sampled.tolist())
-
-    neg_s_idx = np.array(neg_s_idx, dtype=int)
-    neg_t_idx = np.array(neg_t_idx, dtype=int)
+    # Mark every positive pair once; students are visited in order of first appearance
+    pos_mask = np.zeros((nS, nT), dtype=bool)
+    pos_mask[pos_s_idx, pos_t_idx] = True
+    _, first_seen = np.unique(pos_s_idx, return_index=True)
+    users = pos_s_idx[np.sort(first_seen)]
+
+    user_pos = pos_mask[users]
+    pos_count = np.count_nonzero(user_pos, axis=1)
+    num_negs = np.maximum(1, neg_ratio * pos_count).astype(int)
+    choose = np.minimum(num_negs, nT - pos_count)
+
+    k = int(choose.max(initial=0))
+    if k > 0:
+        # Positives get keys above every negative, so the k smallest uniform keys of a row
+        # are a sample without replacement from that student's negatives
+        keys = RNG.random(user_pos.shape)
+        keys[user_pos] = 2.0
+        cand = np.argpartition(keys, k - 1, axis=1)[:, :k]
+        cand = np.take_along_axis(cand, np.argsort(np.take_along_axis(keys, cand, axis=1), axis=1), axis=1)
+        rows, ranks = np.nonzero(np.arange(k)[None, :] < choose[:, None])
+        neg_s_idx = users[rows]
+        neg_t_idx = cand[rows, ranks]
+    else:
+        neg_s_idx = np.zeros(0, dtype=int)
+        neg_t_idx = np.zeros(0, dtype=int)
 
     # Build X and y
-    X_pos = compute_pair_features(students, tutors, pos_s_idx, pos_t_idx)
-    X_neg = compute_pair_features(students, tutors, neg_s_idx, neg_t_idx)
+    student_cols = build_columns(students, STUDENT_COLUMNS)
+    tutor_cols = build_columns(tutors, TUTOR_COLUMNS)
+    X_pos = compute_pair_features(students, tutors, pos_s_idx, pos_t_idx, student_cols, tutor_cols)
+    X_neg = compute_pair_features(students, tutors, neg_s_idx, neg_t_idx, student_cols, tutor_cols)
     X = np.vstack([X_pos, X_neg])
     y = np.hstack([np.ones(len(X_pos)), np.zeros(len(X_neg))])
 
@@ -373,14 +525,12 @@ def sample_lr_dataset(students, tutors,
 def evaluate_model(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
     y_true = y_true.astype(int)
     y_pred = y_pred.astype(int)
-    tp = np.sum((y_true == 1) & (y_pred == 1))
-    tn = np.sum((y_true == 0) & (y_pred == 0))
-    fp = np.sum((y_true == 0) & (y_pred == 1))
-    fn = np.sum((y_true == 1) & (y_pred == 0))
+    # One pass: cell code 2*actual + predicted counts tn, fp, fn, tp
+    tn, fp, fn, tp = np.bincount(2 * y_true + y_pred, minlength=4)
     accuracy = (tp + tn) / max(1, (tp + tn + fp + fn))
     precision = tp / max(1, (tp + fp))
     recall = tp / max(1, (tp + fn))
-    f1 = 2 * precision * recall / max(1e-12, (precision + recall)) if (precision + recall) > 0 else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0
     return {'accuracy': float(accuracy), 'precision': float(precision), 'recall': float(recall), 'f1': float(f1)}
 
 
@@ -464,11 +614,9 @@ def main():
     # LR-only ranking (for comparison)
     sidx = sid_to_idx[sample_sid]
     lr_scores = hybrid.lr_scores_for_student(sidx)
-    # mask seen
+    # mask seen (lr_scores is a row of the fit-time cache, so it is not masked in place)
     seen = hybrid.cf_model.interaction_matrix[sidx, :] > 0
-    lr_scores = np.where(seen, -np.inf, lr_scores)
-    top_lr = np.argpartition(-lr_scores, kth=4)[:5]
-    top_lr = top_lr[np.argsort(-lr_scores[top_lr])]
+    top_lr = top_k_indices(lr_scores, 5, seen=seen)
     recs_lr_only = [idx_to_tid[int(i)] for i in top_lr]
 
     recs_cf = hybrid.cf_model.recommend_for_student(sample_sid, top_k=5)